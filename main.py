@@ -1,17 +1,97 @@
 import functions_framework
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import asyncio
+import ahocorasick
+import bisect
+from bs4 import BeautifulSoup, UnicodeDammit
+import lxml.html
+from lxml import etree
 import re
 import datetime
-import json
+import orjson
 import logging
 import os
+import string
+import threading
+from collections import Counter
 from google.cloud import storage
+from google.cloud.exceptions import NotFound
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+_STORAGE_CLIENT = None
+_BUCKETS = {}
+_HIST_CACHE = {'etag': None, 'archived': b'', 'data': None}
+_MONITOR = None
+_MONITOR_LOCK = threading.Lock()
+
+def _get_storage_client():
+    """Return the storage client, reused across warm invocations"""
+    global _STORAGE_CLIENT
+    if _STORAGE_CLIENT is None:
+        _STORAGE_CLIENT = storage.Client()
+    return _STORAGE_CLIENT
+
+def _get_bucket(bucket_name):
+    """Return a memoized bucket handle"""
+    if bucket_name not in _BUCKETS:
+        _BUCKETS[bucket_name] = _get_storage_client().bucket(bucket_name)
+    return _BUCKETS[bucket_name]
+
+
 class FedMonitor:
+    MAX_DOCUMENT_BYTES = 5 * 1024 * 1024
+    FETCH_CHUNK_SIZE = 64 * 1024
+    FETCH_RETRIES = 2
+    FETCH_BACKOFF_FACTOR = 0.3
+    DATE_PROBE_LIMIT = 5
+    DATE_SCAN_CHARS = 5000
+    HISTORY_BLOB = 'historical_statements.ndjson'
+    LEGACY_HISTORY_BLOB = 'historical_statements.json'
+    HISTORY_WINDOW = 50
+    
+    _RE_DATE = re.compile(r'([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})')
+    _RE_PRESS = re.compile(r'pressreleases/monetary')
+    _RE_RATE = re.compile(r'(?:decided to|committee will|has decided to|agreed to|decided|appropriate to|increase the target range for the federal funds rate to|decided that the|decided to maintain|will maintain)([^\.;]+)(?:federal funds rate|policy rate|interest rate|interest rates|basis points|percentage point|target range)([^\.;]*)', re.IGNORECASE)
+    _RE_BALANCE = re.compile(r'(?:balance sheet|securities holdings|asset purchases|quantitative|maturity extension|reinvestment|reinvesting|redemptions)([^\.;]{10,150})', re.IGNORECASE)
+    _RE_GUIDANCE = re.compile(r'(?:future adjustments|future increases|subsequent meeting|coming months|going forward|remain vigilant|remains highly attentive|future policy|will be prepared to adjust|the committee anticipates|the committee expects|the committee is strongly committed|appropriate path|policy path|outlook|will take into account|in determining)([^\.;]{10,200})', re.IGNORECASE)
+    _RE_DIRECTION = re.compile(r'(shift|change|pivot).{1,30}(stance|policy|direction)')
+    _RE_COMPARATIVE = re.compile(r'(more|increased|stronger|further).{1,20}(restrictive|hawkish|tighten)')
+    _RE_QT = re.compile(r'(balance sheet reduction|quantitative tightening|qt|runoff|run-off)')
+    _RE_RATE_HIKE = re.compile(r'(raise|increase|raising|increasing).{1,30}(federal funds rate|interest rate|target range|policy rate)')
+    _RE_EASING = re.compile(r'(lower|decrease|cut|reduce|pause|hold|reduction).{1,30}(federal funds rate|interest rate|target range|policy rate)')
+    _RE_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+    
+    
+    _XP_TEXT = etree.XPath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+    _XP_ARTICLE_TIME = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' article__time ')]")
+    _XP_LAST_UPDATE = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' lastUpdate ')]")
+    _XP_RELEASE_TEXT = etree.XPath("//text()[contains(., 'For release at') or contains(., 'For immediate release')]")
+    _XP_TITLE = etree.XPath('//h1 | //h2 | //h3 | //h4 | //title')
+    _XP_DATE_PROBES = etree.XPath(
+        "//header | //*[contains(concat(' ', normalize-space(@class), ' '), ' page-title ')] | //h1 | //h2 | //time"
+        " | //*[contains(concat(' ', normalize-space(@class), ' '), ' date ')] | //meta[@name='DC.date']"
+    )
+    _XP_POLICY_COLUMN = etree.XPath("//div[@class='col-xs-12 col-sm-8 col-md-8']")
+    _XP_ARTICLE_CONTENT = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' article__content ')]")
+    _XP_CONTENT_FALLBACKS = [
+        etree.XPath('//main'),
+        etree.XPath('//article'),
+        etree.XPath("//*[@id='content']"),
+        etree.XPath("//*[contains(concat(' ', normalize-space(@class), ' '), ' content ')]"),
+        etree.XPath("//*[contains(concat(' ', normalize-space(@class), ' '), ' main-content ')]")
+    ]
+    _XP_PARAGRAPHS = etree.XPath('.//p')
+    _XP_BODY = etree.XPath('//body')
+    
+    
+    _DIRECTION_LITERALS = ('shift', 'change', 'pivot')
+    _COMPARATIVE_LITERALS = ('restrictive', 'hawkish', 'tighten')
+    _QT_LITERALS = ('balance sheet reduction', 'quantitative tightening', 'qt', 'runoff', 'run-off')
+    _RATE_TARGET_LITERALS = ('federal funds rate', 'interest rate', 'target range', 'policy rate')
+    
     def __init__(self):
         self.fed_urls = {
             'fomc_statements': 'https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm',
@@ -34,34 +114,102 @@ class FedMonitor:
             'commitment to restoring price stability'
         ]
         
+        self._single_keywords = {k.lower(): k for k in self.tightening_keywords if ' ' not in k}
+        self._keyword_automaton = ahocorasick.Automaton()
+        for keyword in self.tightening_keywords:
+            if ' ' in keyword:
+                self._keyword_automaton.add_word(keyword.lower(), keyword)
+        self._keyword_automaton.make_automaton()
         
-        self.bucket_name = os.environ.get('GCS_BUCKET_NAME', 'fed-monitor-data')
-        self.historical_statements = self.load_historical_data()
+        self.interest_phrases = [
+            phrase.lower() for phrase in
+            self.tightening_keywords + ['federal funds rate', 'monetary policy', 'interest rate', 'target range']
+        ]
+        self._interest_automaton = ahocorasick.Automaton()
+        for phrase in self.interest_phrases:
+            self._interest_automaton.add_word(phrase, phrase)
+        self._interest_automaton.make_automaton()
+        
+        
+        self.request_headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml'
+        }
+        self._session = None
         
-    def fetch_document(self, url):
+        self.bucket_name = os.environ.get('GCS_BUCKET_NAME', 'fed-monitor-data')
+        self.refresh_historical_data()
+        
+    def _create_session(self):
+        """Create the HTTP session shared by all fetches in a monitoring cycle"""
+        return aiohttp.ClientSession(
+            headers=self.request_headers,
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(limit=10, limit_per_host=5)
+        )
+    
+    async def _fetch_content(self, url):
+        """Fetch the raw bytes and header charset of a document, retrying connection failures with backoff"""
+        for attempt in range(self.FETCH_RETRIES + 1):
+            try:
+                return await self._read_content(url)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == self.FETCH_RETRIES:
+                    raise
+                delay = self.FETCH_BACKOFF_FACTOR * (2 ** attempt)
+                logger.warning(f"Retrying {url} in {delay:.1f}s after error: {e}")
+                await asyncio.sleep(delay)
+    
+    async def _read_content(self, url):
+        """Read the raw bytes of a document and the charset from its Content-Type header"""
+        logger.info(f"Fetching URL: {url}")
+        async with self._session.get(url) as response:
+            response.raise_for_status()
+            chunks = []
+            total = 0
+            async for chunk in response.content.iter_chunked(self.FETCH_CHUNK_SIZE):
+                total += len(chunk)
+                if total > self.MAX_DOCUMENT_BYTES:
+                    logger.warning(f"Truncating {url} at {self.MAX_DOCUMENT_BYTES} bytes")
+                    break
+                chunks.append(chunk)
+            return b''.join(chunks), response.charset
+    
+    async def fetch_document(self, url):
         """Fetch and parse a document from a given URL"""
         try:
-            logger.info(f"Fetching URL: {url}")
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml'
-            }
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            content, _ = await self._fetch_content(url)
+            soup = BeautifulSoup(content, 'lxml')
             return soup
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
-    def extract_statement_links_from_calendar(self):
+    async def fetch_tree(self, url):
+        """Fetch a document and parse it into an lxml element tree"""
+        try:
+            content, charset = await self._fetch_content(url)
+            encoding = charset or UnicodeDammit(content, is_html=True).original_encoding
+            if encoding:
+                return lxml.html.document_fromstring(content, parser=lxml.html.HTMLParser(encoding=encoding))
+            return lxml.html.document_fromstring(content)
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+    
+    async def extract_statement_links_from_calendar(self):
         """Extract statement links from the FOMC calendar page"""
         logger.info("Extracting statement links from FOMC calendar")
-        soup = self.fetch_document(self.fed_urls['fomc_statements'])
+        calendar_task = asyncio.create_task(self.fetch_document(self.fed_urls['fomc_statements']))
+        latest_task = asyncio.create_task(self.fetch_document(self.fed_urls['latest_statement']))
+        
+        soup = await calendar_task
         if not soup:
+            latest_task.cancel()
             return []
             
         statement_links = []
+        seen = set()
         
         try:
             
@@ -77,8 +225,10 @@ class FedMonitor:
                     href = link['href']
                     if href.startswith('/'):
                         full_url = f"https://www.federalreserve.gov{href}"
-                        statement_links.append(full_url)
-                        logger.info(f"Found statement link: {full_url}")
+                        if full_url not in seen:
+                            seen.add(full_url)
+                            statement_links.append(full_url)
+                            logger.info(f"Found statement link: {full_url}")
         except Exception as e:
             logger.error(f"Error finding statement links from indicators: {e}")
         
@@ -86,14 +236,15 @@ class FedMonitor:
         if not statement_links:
             try:
                 
-                press_links = soup.find_all('a', href=re.compile(r'pressreleases/monetary'))
+                press_links = soup.find_all('a', href=self._RE_PRESS)
                 
                 for link in press_links:
                     if 'statement' in link.get_text().lower() or any(month in link.get_text().lower() for month in ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']):
                         href = link['href']
                         if href.startswith('/'):
                             full_url = f"https://www.federalreserve.gov{href}"
-                            if full_url not in statement_links:
+                            if full_url not in seen:
+                                seen.add(full_url)
                                 statement_links.append(full_url)
                                 logger.info(f"Found press release link: {full_url}")
             except Exception as e:
@@ -101,10 +252,10 @@ class FedMonitor:
         
         
         try:
-            latest_soup = self.fetch_document(self.fed_urls['latest_statement'])
+            latest_soup = await latest_task
             if latest_soup:
                 
-                press_links = latest_soup.find_all('a', href=re.compile(r'pressreleases/monetary'))
+                press_links = latest_soup.find_all('a', href=self._RE_PRESS)
                 
                 for link in press_links:
                     
@@ -112,7 +263,8 @@ class FedMonitor:
                         href = link['href']
                         if href.startswith('/'):
                             full_url = f"https://www.federalreserve.gov{href}"
-                            if full_url not in statement_links:
+                            if full_url not in seen:
+                                seen.add(full_url)
                                 statement_links.append(full_url)
                                 logger.info(f"Found latest press release: {full_url}")
         except Exception as e:
@@ -121,26 +273,32 @@ class FedMonitor:
         logger.info(f"Total statement links found: {len(statement_links)}")
         return statement_links
     
-    def extract_statements(self):
+    async def extract_statements(self):
         """Extract and process FOMC policy statements"""
-        statement_links = self.extract_statement_links_from_calendar()
+        statement_links = await self.extract_statement_links_from_calendar()
         statements = []
         
-        for url in statement_links:
+        trees = await asyncio.gather(
+            *[self.fetch_tree(url) for url in statement_links],
+            return_exceptions=True
+        )
+        
+        for url, tree in zip(statement_links, trees):
             try:
                 logger.info(f"Processing statement: {url}")
-                soup = self.fetch_document(url)
-                if not soup:
+                if isinstance(tree, BaseException):
+                    raise tree
+                if tree is None:
                     continue
                 
                 
-                date = self._extract_date(soup)
+                date = self._extract_date(tree)
                 if not date:
                     logger.warning(f"Could not extract date from {url}")
                     continue
                 
                 
-                text = self._extract_policy_text(soup)
+                text = self._extract_policy_text(tree)
                 if not text or len(text) < 100:  
                     logger.warning(f"Could not extract meaningful text from {url}")
                     continue
@@ -148,6 +306,7 @@ class FedMonitor:
                 logger.info(f"Successfully extracted statement from {date.isoformat()} ({len(text)} chars)")
                 statements.append({
                     'date': date.isoformat(), 
+                    'date_formatted': date.strftime('%B %d, %Y'),
                     'text': text, 
                     'url': url
                 })
@@ -157,55 +316,79 @@ class FedMonitor:
         
         return statements
     
-    def _extract_date(self, soup):
+    def _element_text(self, elem, separator='', strip=False):
+        """Return the text of an lxml element, skipping script and style content"""
+        texts = self._XP_TEXT(elem)
+        if strip:
+            return separator.join(t.strip() for t in texts if t.strip())
+        return separator.join(texts)
+    
+    def _extract_date(self, tree):
         """Extract date from a Fed document with enhanced reliability"""
         try:
             
-            date_elem = soup.find('div', class_='article__time')
-            if date_elem and date_elem.text.strip():
-                date_text = date_elem.text.strip()
+            date_elems = self._XP_ARTICLE_TIME(tree)
+            if date_elems and self._element_text(date_elems[0]).strip():
+                date_text = self._element_text(date_elems[0]).strip()
                 try:
                     return datetime.datetime.strptime(date_text, '%B %d, %Y')
                 except:
                     pass
             
             
-            date_elem = soup.find('div', class_='lastUpdate')
-            if date_elem and date_elem.text.strip():
-                date_text = date_elem.text.strip()
-                date_match = re.search(r'([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_text)
+            date_elems = self._XP_LAST_UPDATE(tree)
+            if date_elems and self._element_text(date_elems[0]).strip():
+                date_text = self._element_text(date_elems[0]).strip()
+                date_match = self._RE_DATE.search(date_text)
                 if date_match:
                     month, day, year = date_match.groups()
                     date_str = f"{month} {day}, {year}"
                     return datetime.datetime.strptime(date_str, '%B %d, %Y')
             
             
-            release_text = soup.find(string=re.compile(r'For release at|For immediate release'))
-            if release_text:
-                parent = release_text.parent
-                if parent:
-                    date_match = re.search(r'([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})', parent.get_text())
+            release_texts = self._XP_RELEASE_TEXT(tree)
+            if release_texts:
+                parent = release_texts[0].getparent()
+                if parent is not None and release_texts[0].is_tail:
+                    parent = parent.getparent()
+                if parent is not None:
+                    date_match = self._RE_DATE.search(self._element_text(parent))
                     if date_match:
                         month, day, year = date_match.groups()
                         date_str = f"{month} {day}, {year}"
                         return datetime.datetime.strptime(date_str, '%B %d, %Y')
             
             
-            title_elem = soup.find(['h1', 'h2', 'h3', 'h4', 'title'])
-            if title_elem:
-                title_text = title_elem.text.strip()
-                date_match = re.search(r'([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})', title_text)
+            title_elems = self._XP_TITLE(tree)
+            if title_elems:
+                title_text = self._element_text(title_elems[0]).strip()
+                date_match = self._RE_DATE.search(title_text)
                 if date_match:
                     month, day, year = date_match.groups()
                     date_str = f"{month} {day}, {year}"
                     return datetime.datetime.strptime(date_str, '%B %d, %Y')
             
             
-            text = soup.get_text()
-            date_matches = re.findall(r'([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})', text)
-            if date_matches:
+            for elem in self._XP_DATE_PROBES(tree)[:self.DATE_PROBE_LIMIT]:
+                snippet = elem.get('content') or self._element_text(elem)
+                date_match = self._RE_DATE.search(snippet)
+                if date_match:
+                    month, day, year = date_match.groups()
+                    date_str = f"{month} {day}, {year}"
+                    return datetime.datetime.strptime(date_str, '%B %d, %Y')
+            
+            
+            parts = []
+            size = 0
+            for text in self._XP_TEXT(tree):
+                parts.append(text)
+                size += len(text)
+                if size >= self.DATE_SCAN_CHARS:
+                    break
+            date_match = self._RE_DATE.search("".join(parts)[:self.DATE_SCAN_CHARS])
+            if date_match:
                 
-                month, day, year = date_matches[0]
+                month, day, year = date_match.groups()
                 date_str = f"{month} {day}, {year}"
                 return datetime.datetime.strptime(date_str, '%B %d, %Y')
                 
@@ -214,56 +397,64 @@ class FedMonitor:
             logger.error(f"Error extracting date: {e}")
             return None
     
-    def _extract_policy_text(self, soup):
+    def _extract_policy_text(self, tree):
         """Extract the policy-focused text from a Fed statement"""
         try:
             
-            content = soup.find('div', class_='col-xs-12 col-sm-8 col-md-8')
-            if content:
+            contents = self._XP_POLICY_COLUMN(tree)
+            if contents:
                 
-                paragraphs = content.find_all('p')
+                paragraphs = self._XP_PARAGRAPHS(contents[0])
                 
-                text = ""
+                parts = []
                 for p in paragraphs:
-                    p_text = p.get_text().strip()
-                    if len(p_text) > 100 or "federal funds rate" in p_text.lower() or "monetary policy" in p_text.lower():
-                        text += p_text + " "
+                    p_text = self._element_text(p).strip()
+                    if len(p_text) > 100:
+                        parts.append(p_text)
+                        continue
+                    p_lower = p_text.lower()
+                    if "federal funds rate" in p_lower or "monetary policy" in p_lower:
+                        parts.append(p_text)
                 
-                if text:
-                    return text.strip()
+                if parts:
+                    return " ".join(parts)
             
             
-            content = soup.find('div', class_='article__content')
-            if content:
-                return content.get_text(separator=' ', strip=True)
+            contents = self._XP_ARTICLE_CONTENT(tree)
+            if contents:
+                return self._element_text(contents[0], separator=' ', strip=True)
             
             
-            for selector in ['main', 'article', '#content', '.content', '.main-content']:
-                content = soup.select_one(selector)
-                if content:
-                    return content.get_text(separator=' ', strip=True)
+            for xpath in self._XP_CONTENT_FALLBACKS:
+                contents = xpath(tree)
+                if contents:
+                    return self._element_text(contents[0], separator=' ', strip=True)
             
             
-            paragraphs = soup.find_all('p')
+            paragraphs = self._XP_PARAGRAPHS(tree)
             if paragraphs:
-                return " ".join([p.get_text().strip() for p in paragraphs])
+                return " ".join([self._element_text(p).strip() for p in paragraphs])
             
             
-            body = soup.find('body')
-            if body:
-                return body.get_text(separator=' ', strip=True)
+            bodies = self._XP_BODY(tree)
+            if bodies:
+                return self._element_text(bodies[0], separator=' ', strip=True)
                 
             return ""
         except Exception as e:
             logger.error(f"Error extracting text: {e}")
             return ""
         
+    def _contains_any(self, text, literals):
+        """Cheap substring check used to skip regex scans that cannot match"""
+        return any(literal in text for literal in literals)
+    
     def extract_policy_decisions(self, text):
         """Extract specific policy decisions from the statement text"""
         decisions = []
         
         
-        rate_matches = re.findall(r'(?:decided to|committee will|has decided to|agreed to|decided|appropriate to|increase the target range for the federal funds rate to|decided that the|decided to maintain|will maintain)([^\.;]+)(?:federal funds rate|policy rate|interest rate|interest rates|basis points|percentage point|target range)([^\.;]*)', text, re.IGNORECASE)
+        rate_matches = self._RE_RATE.findall(text)
         
         for match in rate_matches:
             decision = "".join(match).strip()
@@ -271,14 +462,14 @@ class FedMonitor:
                 decisions.append(f"Rate Decision: {decision}")
         
         
-        balance_sheet_matches = re.findall(r'(?:balance sheet|securities holdings|asset purchases|quantitative|maturity extension|reinvestment|reinvesting|redemptions)([^\.;]{10,150})', text, re.IGNORECASE)
+        balance_sheet_matches = self._RE_BALANCE.findall(text)
         
         for match in balance_sheet_matches:
             if match and len(match) > 15:
                 decisions.append(f"Balance Sheet: {match.strip()}")
         
         
-        guidance_matches = re.findall(r'(?:future adjustments|future increases|subsequent meeting|coming months|going forward|remain vigilant|remains highly attentive|future policy|will be prepared to adjust|the committee anticipates|the committee expects|the committee is strongly committed|appropriate path|policy path|outlook|will take into account|in determining)([^\.;]{10,200})', text, re.IGNORECASE)
+        guidance_matches = self._RE_GUIDANCE.findall(text)
         
         for match in guidance_matches:
             if match and len(match) > 15:
@@ -291,38 +482,39 @@ class FedMonitor:
         if not text:
             return 0, [], []
             
-        words = text.lower().split()
         text_lower = text.lower()
+        words = text_lower.split()
         
         
-        tightening_count = 0
-        found_keywords = []
-        
-        for keyword in self.tightening_keywords:
-            if keyword.lower() in text_lower:
-                count = text_lower.count(keyword.lower())
-                tightening_count += count
-                if count > 0:
-                    found_keywords.append(keyword)
+        keyword_counts = Counter(keyword for _, keyword in self._keyword_automaton.iter(text_lower))
+        word_counts = Counter(word.strip(string.punctuation) for word in words)
+        for word, keyword in self._single_keywords.items():
+            if word_counts[word]:
+                keyword_counts[keyword] += word_counts[word]
+        tightening_count = sum(keyword_counts.values())
+        found_keywords = [keyword for keyword in self.tightening_keywords if keyword_counts[keyword]]
         
         
         
         direction_change = False
-        if re.search(r'(shift|change|pivot).{1,30}(stance|policy|direction)', text_lower):
+        if self._contains_any(text_lower, self._DIRECTION_LITERALS) and self._RE_DIRECTION.search(text_lower):
             direction_change = True
         
         
         comparative_tightening = False
-        if re.search(r'(more|increased|stronger|further).{1,20}(restrictive|hawkish|tighten)', text_lower):
+        if self._contains_any(text_lower, self._COMPARATIVE_LITERALS) and self._RE_COMPARATIVE.search(text_lower):
             comparative_tightening = True
             tightening_count += 2
         
         
-        qt_mentions = len(re.findall(r'(balance sheet reduction|quantitative tightening|qt|runoff|run-off)', text_lower))
-        tightening_count += qt_mentions
+        if self._contains_any(text_lower, self._QT_LITERALS):
+            qt_mentions = len(self._RE_QT.findall(text_lower))
+            tightening_count += qt_mentions
+        
         
+        mentions_rate_target = self._contains_any(text_lower, self._RATE_TARGET_LITERALS)
         
-        rate_hike = re.search(r'(raise|increase|raising|increasing).{1,30}(federal funds rate|interest rate|target range|policy rate)', text_lower)
+        rate_hike = mentions_rate_target and self._RE_RATE_HIKE.search(text_lower)
         if rate_hike:
             tightening_count += 3
         
@@ -342,7 +534,7 @@ class FedMonitor:
             base_score += 10
         
         
-        easing_language = re.search(r'(lower|decrease|cut|reduce|pause|hold|reduction).{1,30}(federal funds rate|interest rate|target range|policy rate)', text_lower)
+        easing_language = mentions_rate_target and self._RE_EASING.search(text_lower)
         if easing_language:
             base_score -= 20
         
@@ -372,10 +564,21 @@ class FedMonitor:
         else:
             return f"No significant policy shift: {difference:.1f} points"
     
+    def split_sentences(self, text):
+        """Split text into sentences in one pass, returning them with their start offsets"""
+        sentences = []
+        starts = [0]
+        for separator in self._RE_SENTENCE_SPLIT.finditer(text):
+            sentences.append(text[starts[-1]:separator.start()])
+            starts.append(separator.end())
+        sentences.append(text[starts[-1]:])
+        return sentences, starts
+    
     def generate_summary(self, statement, comparison_result):
         """Generate a summary of the Fed statement analysis"""
-        date_obj = datetime.datetime.fromisoformat(statement['date'])
-        formatted_date = date_obj.strftime('%B %d, %Y')
+        formatted_date = statement.get('date_formatted')
+        if not formatted_date:
+            formatted_date = datetime.datetime.fromisoformat(statement['date']).strftime('%B %d, %Y')
         
         summary = f"Date: {formatted_date}\n"
         summary += f"Tightening Score: {statement['tightening_score']:.1f}/100\n"
@@ -393,53 +596,109 @@ class FedMonitor:
         
         summary += "\nRelevant Excerpts:\n"
         
-        sentences = re.split(r'(?<=[.!?])\s+', statement['text'])
+        text_lower = statement['text'].lower()
+        sentences, sentence_starts = self.split_sentences(statement['text'])
+        if len(text_lower) != len(statement['text']):
+            sentence_starts = self.split_sentences(text_lower)[1]
         relevant_sentences = []
         
-        interest_phrases = self.tightening_keywords + ['federal funds rate', 'monetary policy', 'interest rate', 'target range']
         
-        for sentence in sentences:
-            for phrase in interest_phrases:
-                if phrase.lower() in sentence.lower():
-                    clean_sentence = sentence.strip()
-                    if clean_sentence and clean_sentence not in relevant_sentences:
-                        relevant_sentences.append(clean_sentence)
-                        break
+        last_index = -1
+        for end, _ in self._interest_automaton.iter(text_lower):
+            index = bisect.bisect_right(sentence_starts, end) - 1
+            if index == last_index:
+                continue
+            last_index = index
+            
+            clean_sentence = sentences[index].strip()
+            if clean_sentence and clean_sentence not in relevant_sentences:
+                relevant_sentences.append(clean_sentence)
+                if len(relevant_sentences) == 5:
+                    break
         
         
-        for i, sentence in enumerate(relevant_sentences[:5]):
+        for i, sentence in enumerate(relevant_sentences):
             summary += f"{i+1}. {sentence}\n"
         
         summary += f"\nFull statement: {statement['url']}"
         
         return summary
     
+    def refresh_historical_data(self):
+        """Load recent historical statements and index them by date"""
+        self._archived_history, records = self.load_historical_data()
+        self._by_date = {s['date']: s for s in records}
+        self._dates_sorted = sorted(self._by_date)
+        self._archived_count = self._archived_history.count(b'\n') + 1 if self._archived_history else 0
+    
+    @property
+    def historical_statements(self):
+        """Loaded historical statements as a list ordered by date"""
+        return [self._by_date[date] for date in self._dates_sorted]
+    
+    def _find_previous_statement(self, date):
+        """Return the most recent historical statement strictly before date"""
+        index = bisect.bisect_left(self._dates_sorted, date)
+        if index == 0:
+            return None
+        return self._by_date[self._dates_sorted[index - 1]]
+    
+    def _split_history(self, data):
+        """Split NDJSON history into the raw archived prefix and the parsed recent records"""
+        lines = data.strip().rsplit(b'\n', self.HISTORY_WINDOW)
+        archived = b''
+        if len(lines) > self.HISTORY_WINDOW:
+            archived = lines.pop(0)
+        records = [orjson.loads(line) for line in lines if line.strip()]
+        return archived, records
+    
+    def _load_legacy_history(self, bucket):
+        """Load the old single-document JSON history, split like the NDJSON history"""
+        blob = bucket.blob(self.LEGACY_HISTORY_BLOB)
+        if not blob.exists():
+            return b'', []
+        
+        data = sorted(orjson.loads(blob.download_as_bytes()), key=lambda x: x['date'])
+        logger.info(f"Migrating {len(data)} historical statements from {self.LEGACY_HISTORY_BLOB}")
+        return self._split_history(b'\n'.join(orjson.dumps(s) for s in data))
+    
     def load_historical_data(self):
-        """Load historical statements from Google Cloud Storage"""
+        """Load historical statements from Google Cloud Storage as (archived NDJSON bytes, recent records)"""
         try:
-            storage_client = storage.Client()
+            bucket = _get_bucket(self.bucket_name)
             try:
-                bucket = storage_client.bucket(self.bucket_name)
-                blob = bucket.blob('historical_statements.json')
+                blob = bucket.blob(self.HISTORY_BLOB)
                 
-                if blob.exists():
-                    data = json.loads(blob.download_as_string())
-                    logger.info(f"Loaded {len(data)} historical statements")
-                    return data
-                else:
-                    logger.info("No historical data found. Starting fresh.")
-                    return []
+                try:
+                    blob.reload()
+                except NotFound:
+                    archived, data = self._load_legacy_history(bucket)
+                    if not data:
+                        logger.info("No historical data found. Starting fresh.")
+                    return archived, data
+                
+                if blob.etag == _HIST_CACHE['etag']:
+                    data = list(_HIST_CACHE['data'])
+                    logger.info(f"Using {len(data)} cached historical statements")
+                    return _HIST_CACHE['archived'], data
+                
+                archived, data = self._split_history(blob.download_as_bytes())
+                _HIST_CACHE['etag'] = blob.etag
+                _HIST_CACHE['archived'] = archived
+                _HIST_CACHE['data'] = list(data)
+                logger.info(f"Loaded {len(data)} recent historical statements")
+                return archived, data
             except Exception as e:
                 logger.warning(f"Error accessing bucket: {e}. Will create new bucket.")
-                return []
+                return b'', []
         except Exception as e:
             logger.error(f"Error loading historical data: {e}")
-            return []
+            return b'', []
     
     def save_historical_data(self):
         """Save historical statements to Google Cloud Storage"""
         try:
-            storage_client = storage.Client()
+            storage_client = _get_storage_client()
             
             
             try:
@@ -447,36 +706,58 @@ class FedMonitor:
             except Exception:
                 bucket = storage_client.create_bucket(self.bucket_name, location="us-central1")
                 logger.info(f"Bucket {self.bucket_name} created.")
-            
-            blob = bucket.blob('historical_statements.json')
-            blob.upload_from_string(json.dumps(self.historical_statements))
-            logger.info(f"Saved {len(self.historical_statements)} historical statements")
+            _BUCKETS[self.bucket_name] = bucket
+            
+            blob = bucket.blob(self.HISTORY_BLOB)
+            historical_statements = self.historical_statements
+            lines = [orjson.dumps(s) for s in historical_statements]
+            if self._archived_history:
+                lines.insert(0, self._archived_history)
+            blob.upload_from_string(b'\n'.join(lines), content_type='application/x-ndjson')
+            _HIST_CACHE['etag'] = blob.etag
+            _HIST_CACHE['archived'] = self._archived_history
+            _HIST_CACHE['data'] = historical_statements
+            logger.info(f"Saved {len(historical_statements)} historical statements")
         except Exception as e:
             logger.error(f"Error saving historical data: {e}")
     
     def run_monitoring_cycle(self, force=False):
         """Run a full monitoring cycle and return results"""
+        return asyncio.run(self.run_monitoring_cycle_async(force=force))
+    
+    async def run_monitoring_cycle_async(self, force=False):
+        """Run a full monitoring cycle asynchronously and return results"""
         results = {
             'new_statements': [],
             'tightening_alerts': [],
             'status': 'success',
             'debug_info': {
                 'start_time': datetime.datetime.now().isoformat(),
-                'historical_statements_count': len(self.historical_statements)
+                'historical_statements_count': self._archived_count + len(self._by_date)
             }
         }
         
         try:
             
-            statements = self.extract_statements()
+            async with self._create_session() as session:
+                self._session = session
+                try:
+                    statements = await self.extract_statements()
+                finally:
+                    self._session = None
             results['debug_info']['statements_found'] = len(statements)
             
             
-            existing_dates = {item['date']: item for item in self.historical_statements}
+            existing_dates = set(self._by_date)
+            oldest_loaded_date = self._dates_sorted[0] if self._archived_history else None
             
             
             for statement in statements:
                 
+                if oldest_loaded_date and statement['date'] < oldest_loaded_date:
+                    logger.info(f"Skipping {statement['url']}: {statement['date']} is older than the loaded history window")
+                    continue
+                
                 if force or statement['date'] not in existing_dates:
                     
                     score, keywords, policy_decisions = self.analyze_tightening_signals(statement['text'])
@@ -484,6 +765,7 @@ class FedMonitor:
                     
                     new_statement = {
                         'date': statement['date'],
+                        'date_formatted': statement['date_formatted'],
                         'text': statement['text'][:1000] + "..." if len(statement['text']) > 1000 else statement['text'],  
                         'tightening_score': score,
                         'tightening_keywords': keywords,
@@ -501,29 +783,17 @@ class FedMonitor:
                     
                     
                     if not force and statement['date'] not in existing_dates:
-                        self.historical_statements.append(new_statement)
+                        if statement['date'] not in self._by_date:
+                            bisect.insort(self._dates_sorted, statement['date'])
+                        self._by_date[statement['date']] = new_statement
                     elif force and statement['date'] in existing_dates:
                         
-                        self.historical_statements = [
-                            s if s['date'] != statement['date'] else new_statement 
-                            for s in self.historical_statements
-                        ]
+                        self._by_date[statement['date']] = new_statement
                     
                     
-                    if len(self.historical_statements) > 1:
-                        
-                        sorted_statements = sorted(
-                            self.historical_statements, 
-                            key=lambda x: x['date'], 
-                            reverse=True
-                        )
+                    if len(self._by_date) > 1:
                         
-                        
-                        previous = None
-                        for stmt in sorted_statements:
-                            if stmt['date'] < new_statement['date']:
-                                previous = stmt
-                                break
+                        previous = self._find_previous_statement(new_statement['date'])
                         
                         if previous:
                             comparison = self.compare_to_previous(new_statement, previous)
@@ -543,7 +813,7 @@ class FedMonitor:
             
             results['debug_info']['end_time'] = datetime.datetime.now().isoformat()
             results['debug_info']['new_statements_processed'] = len(results['new_statements'])
-            results['debug_info']['final_historical_count'] = len(self.historical_statements)
+            results['debug_info']['final_historical_count'] = self._archived_count + len(self._by_date)
             
         except Exception as e:
             logger.error(f"Error in monitoring cycle: {e}")
@@ -552,6 +822,15 @@ class FedMonitor:
         
         return results
 
+def _get_monitor():
+    """Return the module-level monitor, constructing it on cold start. Callers must hold _MONITOR_LOCK"""
+    global _MONITOR
+    if _MONITOR is None:
+        _MONITOR = FedMonitor()
+    else:
+        _MONITOR.refresh_historical_data()
+    return _MONITOR
+
 @functions_framework.http
 def fed_monitor_http(request):
     """HTTP Cloud Function to monitor Fed statements.
@@ -569,10 +848,11 @@ def fed_monitor_http(request):
     
     try:
         
-        monitor = FedMonitor()
-        
-        
-        results = monitor.run_monitoring_cycle(force=force_run)
+        with _MONITOR_LOCK:
+            monitor = _get_monitor()
+            
+            
+            results = asyncio.run(monitor.run_monitoring_cycle_async(force=force_run))
         
         
         if not debug_mode and 'debug_info' in results:
@@ -585,12 +865,12 @@ def fed_monitor_http(request):
         }
         
         
-        return json.dumps(response, indent=2), 200, {'Content-Type': 'application/json'}
+        return orjson.dumps(response, option=orjson.OPT_INDENT_2).decode(), 200, {'Content-Type': 'application/json'}
     
     except Exception as e:
         error_message = f"Error processing request: {str(e)}"
         logger.error(error_message)
-        return json.dumps({
+        return orjson.dumps({
             'status': 'error',
             'error': error_message
-        }), 500, {'Content-Type': 'application/json'}
\ No newline at end of file
+        }).decode(), 500, {'Content-Type': 'application/json'}
\ No newline at end of file